@@ -32,6 +32,7 @@ class Settings:
     
     # Model Configuration
     EMBEDDING_MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
+    PREDICTION_CACHE_SIZE: int = 4096
     
     # Price Constraints
     PRICE_CONSTRAINTS: Dict[str, tuple] = {
@@ -58,6 +59,9 @@ class Settings:
     CORS_METHODS: list = ["*"]
     CORS_HEADERS: list = ["*"]
     
+    # Set once the artifact and ChromaDB directories have been created
+    _directories_ensured: bool = False
+    
     @classmethod
     def get_env_variable(cls, key: str, default: Any = None) -> Any:
         """Get environment variable with fallback to default."""
@@ -65,9 +69,12 @@ class Settings:
     
     @classmethod
     def ensure_directories(cls) -> None:
-        """Ensure required directories exist."""
+        """Ensure required directories exist (only touches the filesystem on the first call)."""
+        if cls._directories_ensured:
+            return
         cls.ARTIFACTS_DIR.mkdir(exist_ok=True)
         cls.CHROMA_DB_DIR.mkdir(exist_ok=True)
+        cls._directories_ensured = True
 
 # Global settings instance
 settings = Settings()
@@ -19,9 +19,11 @@ from fastapi.openapi.utils import get_openapi
 import uvicorn
 import os
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict
 
 from .config import settings
+from .models.ml_models import get_model_manager
 from .routes import recommend_router, price_predict_router, health_router, trends_router
 
 # Configure logging
@@ -31,11 +33,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create FastAPI application
-app = FastAPI(
-    title=settings.API_TITLE,
-    version=settings.API_VERSION,
-    description="""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup and shutdown.
+    
+    Ensures all required directories exist and loads the models before the first
+    request is served, then logs shutdown once the application stops.
+    """
+    settings.ensure_directories()
+    logger.info(f" {settings.API_TITLE} v{settings.API_VERSION} starting up...")
+    logger.info(f" Artifacts directory: {settings.ARTIFACTS_DIR}")
+    logger.info(f" ChromaDB directory: {settings.CHROMA_DB_DIR}")
+    
+    # Load price and recommendation models now rather than on the first request
+    get_model_manager()
+    logger.info(" Application startup complete")
+    
+    yield
+    
+    logger.info(" Application shutting down...")
+    logger.info(" Application shutdown complete")
+
+# Markdown shown at the top of /docs and /redoc
+API_DOCS_DESCRIPTION = """
     ## GenAI-powered Smart Retail Experience API
     
     A professional AI-powered fashion recommendation and price prediction system.
@@ -83,9 +104,20 @@ app = FastAPI(
     3. Get recommendations: `POST /recommend/products`
     4. Get trends: `GET /trends/colors`, `GET /trends/styles`, `GET /trends/seasonal`
     5. Analyze brands: `POST /trends/brands`
-    """,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    """
+
+# Workers that never serve the docs can skip OpenAPI schema generation entirely (DISABLE_OPENAPI=1)
+OPENAPI_ENABLED = os.getenv("DISABLE_OPENAPI", "0") != "1"
+
+# Create FastAPI application
+app = FastAPI(
+    title=settings.API_TITLE,
+    version=settings.API_VERSION,
+    description=API_DOCS_DESCRIPTION,
+    openapi_url="/openapi.json" if OPENAPI_ENABLED else None,
+    docs_url="/docs" if OPENAPI_ENABLED else None,
+    redoc_url="/redoc" if OPENAPI_ENABLED else None,
+    lifespan=lifespan,
     contact={
         "name": "API Support",
         "email": "support@example.com",
@@ -181,43 +213,21 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """
-    Initialize application on startup.
-    
-    This function is called when the application starts up.
-    It ensures all required directories exist and logs startup information.
-    """
-    # Ensure directories exist
-    settings.ensure_directories()
-    logger.info(f" {settings.API_TITLE} v{settings.API_VERSION} starting up...")
-    logger.info(f" Artifacts directory: {settings.ARTIFACTS_DIR}")
-    logger.info(f" ChromaDB directory: {settings.CHROMA_DB_DIR}")
-    logger.info(" Application startup complete")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Cleanup on application shutdown.
-    
-    This function is called when the application shuts down.
-    Perform any necessary cleanup tasks here.
-    """
-    logger.info(" Application shutting down...")
-    logger.info(" Application shutdown complete")
-
 if __name__ == "__main__":
     # Get port from environment variable or default to 8001
     port = int(os.getenv("PORT", 8001))
     host = os.getenv("HOST", "0.0.0.0")
     
+    # Auto-reload only in development (DEV=1); otherwise fork UVICORN_WORKERS / WEB_CONCURRENCY workers.
+    # Each worker loads its own copy of the models, so the default stays at one.
+    reload = os.getenv("DEV") == "1"
+    workers = int(os.getenv("UVICORN_WORKERS", os.getenv("WEB_CONCURRENCY", 1)))
+    
     uvicorn.run(
         "smart_retail.main:app",
         host=host,
         port=port,
-        reload=True,
+        reload=reload,
+        workers=None if reload else workers,
         log_level="info"
     )
@@ -2,12 +2,13 @@
 ML Models and data models for the Smart Retail system.
 """
 
-from .ml_models import ModelManager, ProductClassifier
+from .ml_models import ModelManager, ProductClassifier, get_model_manager
 from .data_models import PriceRequest, SearchRequest, PredictionResponse, RecommendationResponse
 
 __all__ = [
     "ModelManager",
     "ProductClassifier", 
+    "get_model_manager",
     "PriceRequest",
     "SearchRequest",
     "PredictionResponse",
@@ -2,82 +2,80 @@
 Pydantic data models for request/response validation.
 """
 
-from pydantic import BaseModel, Field, field_validator
+import os
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# Build validation schemas on first use rather than at import (set SMART_RETAIL_DEFER_BUILD=0 to disable)
+DEFER_BUILD = os.getenv("SMART_RETAIL_DEFER_BUILD", "1") == "1"
+
+VALID_GENDERS = frozenset(('men', 'women', 'unisex', 'boys', 'girls'))
+VALID_GENDERS_MESSAGE = 'Gender must be one of: men, women, unisex, boys, girls'
+
 class PriceRequest(BaseModel):
     """Request model for price prediction."""
     product_name: str = Field(
         ...,
         description="Name of the product",
-        example="Men Solid Casual Shirt",
         min_length=1,
         max_length=500
     )
     brand: str = Field(
         ...,
         description="Brand of the product",
-        example="roadster",
         min_length=1,
         max_length=100
     )
     gender: str = Field(
         ...,
-        description="Target gender (men, women, unisex, boys, girls)",
-        example="men"
+        description="Target gender (men, women, unisex, boys, girls)"
     )
     
     @field_validator('gender')
     @classmethod
     def validate_gender(cls, v: str) -> str:
         """Validate gender field."""
-        valid_genders = ['men', 'women', 'unisex', 'boys', 'girls']
         v_lower = v.lower()
-        if v_lower not in valid_genders:
-            raise ValueError(f'Gender must be one of: {", ".join(valid_genders)}')
+        if v_lower not in VALID_GENDERS:
+            raise ValueError(VALID_GENDERS_MESSAGE)
         return v_lower
     category: str = Field(
         ...,
         description="Product category (e.g., shirt, jeans, dress, shoes, jacket)",
-        example="shirt",
         min_length=1,
         max_length=100
     )
     fabric: Optional[str] = Field(
         None,
         description="Fabric type (e.g., cotton, polyester, silk, denim)",
-        example="cotton",
         max_length=100
     )
     pattern: Optional[str] = Field(
         None,
         description="Pattern type (e.g., solid, striped, printed, checked)",
-        example="solid",
         max_length=100
     )
     color: Optional[str] = Field(
         None,
         description="Color of the product",
-        example="blue",
         max_length=50
     )
     rating_count: int = Field(
         0,
         ge=0,
-        description="Number of ratings/reviews",
-        example=500
+        description="Number of ratings/reviews"
     )
     discount_percent: float = Field(
         0.0,
         ge=0.0,
         le=100.0,
-        description="Discount percentage (0-100)",
-        example=40.0
+        description="Discount percentage (0-100)"
     )
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=DEFER_BUILD,
+        json_schema_extra={
             "example": {
                 "product_name": "Men Solid Casual Shirt",
                 "brand": "roadster",
@@ -90,13 +88,13 @@ class PriceRequest(BaseModel):
                 "discount_percent": 40.0
             }
         }
+    )
 
 class SearchRequest(BaseModel):
     """Request model for product search/recommendation."""
     query: str = Field(
         ...,
         description="Search query text (e.g., 'blue denim jacket for men')",
-        example="blue denim jacket for men",
         min_length=1,
         max_length=500
     )
@@ -104,40 +102,37 @@ class SearchRequest(BaseModel):
         10,
         ge=1,
         le=50,
-        description="Number of results to return (1-50)",
-        example=10
+        description="Number of results to return (1-50)"
     )
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=DEFER_BUILD,
+        json_schema_extra={
             "example": {
                 "query": "blue denim jacket for men",
                 "k": 10
             }
         }
+    )
 
 class PredictionResponse(BaseModel):
     """Response model for price prediction."""
     predicted_price: float = Field(
         ...,
         description="Predicted price in INR",
-        example=899.50,
         ge=0
     )
     product_type: str = Field(
         ...,
-        description="Classified product type (jewelry, watches, luxury_apparel, apparel)",
-        example="apparel"
+        description="Classified product type (jewelry, watches, luxury_apparel, apparel)"
     )
     model_type: str = Field(
         ...,
-        description="Type of model used (fast_multi_model, original_single_model, fallback_model)",
-        example="fast_multi_model"
+        description="Type of model used (fast_multi_model, original_single_model, fallback_model)"
     )
     confidence: str = Field(
         ...,
-        description="Confidence level (High, Medium, Low)",
-        example="Medium"
+        description="Confidence level (High, Medium, Low)"
     )
     timestamp: datetime = Field(
         default_factory=datetime.now,
@@ -148,8 +143,9 @@ class PredictionResponse(BaseModel):
         description="Explanation of the prediction (optional, requires explain=True in request)"
     )
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=DEFER_BUILD,
+        json_schema_extra={
             "example": {
                 "predicted_price": 899.50,
                 "product_type": "apparel",
@@ -159,6 +155,7 @@ class PredictionResponse(BaseModel):
                 "explanation": None
             }
         }
+    )
 
 class RecommendationItem(BaseModel):
     """Individual recommendation item."""
@@ -167,6 +164,8 @@ class RecommendationItem(BaseModel):
     metadata: Dict[str, Any] = Field(..., description="Product metadata")
     distance: Optional[float] = Field(None, description="Similarity distance")
     score: Optional[float] = Field(None, description="Recommendation score")
+    
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
 class RecommendationResponse(BaseModel):
     """Response model for product recommendations."""
@@ -174,6 +173,8 @@ class RecommendationResponse(BaseModel):
     query: str = Field(..., description="Original search query")
     total_results: int = Field(..., description="Total number of results")
     timestamp: datetime = Field(default_factory=datetime.now)
+    
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -185,3 +186,5 @@ class HealthResponse(BaseModel):
     embedding_model_loaded: bool = Field(..., description="Embedding model availability")
     model_type_in_use: str = Field(..., description="Currently active model type")
     timestamp: datetime = Field(default_factory=datetime.now)
+    
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
@@ -4,6 +4,7 @@ ML Model management and product classification.
 
 import os
 import joblib
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Tuple
@@ -15,6 +16,7 @@ import re
 
 try:
     import chromadb
+    import torch
     from sentence_transformers import SentenceTransformer
     CHROMADB_AVAILABLE = True
 except ImportError:
@@ -40,17 +42,24 @@ class ProductClassifier:
         'cashmere', 'silk', 'leather', 'wool', 'pashmina', 'georgette', 'velvet'
     ]
     
+    # One alternation per keyword list, compiled at import; matched against lowercased text
+    JEWELRY_PATTERN = re.compile('|'.join(map(re.escape, JEWELRY_KEYWORDS)))
+    WATCH_PATTERN = re.compile('|'.join(map(re.escape, WATCH_KEYWORDS)))
+    LUXURY_PATTERN = re.compile('|'.join(map(re.escape, LUXURY_KEYWORDS)))
+    
     @classmethod
     def classify_product_type(cls, product_data: Dict[str, Any]) -> str:
         """Classify products into different types based on category and keywords."""
         category = str(product_data.get('category', '')).lower()
         product_name = str(product_data.get('product_name', '')).lower()
+        # Keywords contain no spaces, so searching the joined text never matches across the two fields
+        text = f"{category} {product_name}"
         
-        if any(keyword in category or keyword in product_name for keyword in cls.JEWELRY_KEYWORDS):
+        if cls.JEWELRY_PATTERN.search(text):
             return 'jewelry'
-        elif any(keyword in category or keyword in product_name for keyword in cls.WATCH_KEYWORDS):
+        elif cls.WATCH_PATTERN.search(text):
             return 'watches'
-        elif any(keyword in product_name for keyword in cls.LUXURY_KEYWORDS):
+        elif cls.LUXURY_PATTERN.search(product_name):
             return 'luxury_apparel'
         else:
             return 'apparel'
@@ -63,6 +72,8 @@ class ModelManager:
         self.original_model = None
         self.rec_collection = None
         self.embedding_model = None
+        # Identical requests (e.g. re-sent while the user tweaks the UI) skip feature extraction and the model
+        self._cached_predict_price = lru_cache(maxsize=settings.PREDICTION_CACHE_SIZE)(self._predict_price_from_items)
         self._load_models()
     
     def _load_models(self):
@@ -101,12 +112,10 @@ class ModelManager:
             except Exception as e:
                 print(f"Could not load fallback model: {e}")
         
-        # Create simple model if none available
-        if not self.fast_models and not self.original_model:
-            self._create_fallback_model()
+        # If nothing loaded, the simple fallback model is built on the first prediction request
     
     def _create_fallback_model(self):
-        """Create a simple fallback model if no models are available."""
+        """Create a simple fallback model if no models are available and persist it for later boots."""
         try:
             print("Creating simple fallback model...")
             
@@ -132,16 +141,12 @@ class ModelManager:
             brand_multiplier = {'nike': 1.5, 'adidas': 1.4, 'zara': 1.2, 'h&m': 1.0, 'roadster': 0.8}
             category_multiplier = {'shoes': 1.3, 'dress': 1.2, 'jeans': 1.1, 'shirt': 1.0}
             
-            prices = []
-            for _, row in df.iterrows():
-                price = base_price
-                price *= brand_multiplier.get(row['brand'], 1.0)
-                price *= category_multiplier.get(row['category'], 1.0)
-                price *= (1 - row['discount_percentage'] / 100)
-                price += np.random.normal(0, 100)
-                prices.append(max(100, price))
+            brand_mul = df['brand'].map(brand_multiplier).fillna(1.0).to_numpy()
+            category_mul = df['category'].map(category_multiplier).fillna(1.0).to_numpy()
+            prices = base_price * brand_mul * category_mul * (1 - df['discount_percentage'].to_numpy() / 100)
+            prices += np.random.normal(0, 100, n_samples)
             
-            df['price'] = prices
+            df['price'] = np.maximum(100, prices)
             
             # Prepare features
             feature_columns = ['brand', 'gender', 'category', 'fabric', 'pattern', 'color', 'number_of_ratings', 'discount_percentage']
@@ -168,6 +173,12 @@ class ModelManager:
             self.original_model = model
             print("Simple fallback model created successfully")
             
+            # Save it so the next start-up loads it instead of retraining
+            try:
+                joblib.dump({'pipeline': model}, settings.FALLBACK_MODEL_PATH)
+            except Exception as e:
+                print(f"Could not save fallback model: {e}")
+            
         except Exception as e:
             print(f"Could not create fallback model: {e}")
     
@@ -178,9 +189,12 @@ class ModelManager:
             return
         
         try:
-            # Load embedding model
-            self.embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL_NAME)
-            print("SentenceTransformer embedding model loaded")
+            # Load embedding model (FP16 on GPU halves activation memory traffic)
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            self.embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL_NAME, device=device)
+            if device == 'cuda':
+                self.embedding_model.half()
+            print(f"SentenceTransformer embedding model loaded on {device}")
             
             # Connect to ChromaDB
             chroma_client = chromadb.PersistentClient(path=str(settings.CHROMA_DB_DIR))
@@ -198,7 +212,14 @@ class ModelManager:
             self.embedding_model = None
     
     def predict_price(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Predict price using the best available model."""
+        """Predict price using the best available model, serving repeated requests from an LRU cache."""
+        return dict(self._cached_predict_price(tuple(product_data.items())))
+    
+    def _predict_price_from_items(self, product_items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+        """Uncached prediction on the hashable (field, value) pairs of a request."""
+        product_data = dict(product_items)
+        if not self.fast_models and not self.original_model:
+            self._create_fallback_model()
         if not self.fast_models and not self.original_model:
             raise ValueError("No price prediction models are loaded")
         
@@ -254,6 +275,10 @@ class ModelManager:
     def _extract_enhanced_features(self, product_data: Dict[str, Any], brand_prestige_scores: Dict[str, float]) -> Dict[str, Any]:
         """Extract enhanced features for the multi-model system."""
         product_name = str(product_data.get('product_name', ''))
+        # Lowercase the name and look the brand up once; every check below reuses them
+        name_lower = product_name.lower()
+        brand = product_data.get('brand', '').lower()
+        avg_price = brand_prestige_scores.get(brand, 0)
         
         features = {
             'has_size': bool(re.search(r'\b(?:xs|s|m|l|xl|xxl|xxxl|small|medium|large)\b', product_name, re.IGNORECASE)),
@@ -262,25 +287,25 @@ class ModelManager:
             'has_discount': float(product_data.get('discount_percent', 0)) > 0,
             'rating_count': int(product_data.get('rating_count', 0)),
             'discount_percent': float(product_data.get('discount_percent', 0)),
-            'brand_avg_price': brand_prestige_scores.get(product_data.get('brand', '').lower(), 0)
+            'brand_avg_price': avg_price
         }
         
         # Material keywords
         materials = ['cotton', 'polyester', 'silk', 'wool', 'denim', 'leather', 'cashmere', 'pashmina', 
                     'georgette', 'velvet', 'linen', 'chiffon', 'organza', 'net', 'lace']
         for material in materials:
-            features[f'has_{material}'] = material.lower() in product_name.lower()
+            features[f'has_{material}'] = material in name_lower
         
         # Style keywords
         styles = ['casual', 'formal', 'sport', 'party', 'wedding', 'ethnic', 'western', 'traditional',
                  'vintage', 'retro', 'modern', 'classic', 'trendy', 'elegant', 'chic']
         for style in styles:
-            features[f'has_{style}'] = style.lower() in product_name.lower()
+            features[f'has_{style}'] = style in name_lower
         
         # Jewelry-specific features
         jewelry_materials = ['gold', 'silver', 'platinum', 'diamond', 'gem', 'stone', 'pearl', 'crystal']
         for material in jewelry_materials:
-            features[f'jewelry_{material}'] = material.lower() in product_name.lower()
+            features[f'jewelry_{material}'] = material in name_lower
         
         karat_match = re.search(r'(\d+)\s*kt', product_name, re.IGNORECASE)
         features['karat'] = float(karat_match.group(1)) if karat_match else 0.0
@@ -288,11 +313,9 @@ class ModelManager:
         # Watch-specific features
         watch_features = ['automatic', 'quartz', 'chronograph', 'digital', 'analog', 'waterproof', 'water resistant']
         for feature in watch_features:
-            features[f'watch_{feature}'] = feature.lower() in product_name.lower()
+            features[f'watch_{feature}'] = feature in name_lower
         
         # Brand prestige
-        brand = product_data.get('brand', '').lower()
-        avg_price = brand_prestige_scores.get(brand, 0)
         if avg_price >= 5000:
             features['brand_prestige'] = 'ultra_premium'
         elif avg_price >= 2000:
@@ -306,9 +329,9 @@ class ModelManager:
         luxury_keywords = ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade',
                           'embroidered', 'sequined', 'beaded', 'crystal', 'swarovski']
         for keyword in luxury_keywords:
-            features[f'luxury_{keyword}'] = keyword.lower() in product_name.lower()
+            features[f'luxury_{keyword}'] = keyword in name_lower
         
-        features['price_range'] = 'medium'  # Default
+        features['price_range'] = 2  # Default: 'medium' price range code
         
         return features
     
@@ -323,7 +346,12 @@ class ModelManager:
                 return {"results": []}
             
             # Generate embedding for query
-            query_embedding = self.embedding_model.encode(query, normalize_embeddings=True).tolist()
+            query_embedding = self.embedding_model.encode(
+                query,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            ).tolist()
             
             # Query ChromaDB
             res = self.rec_collection.query(
@@ -364,3 +392,9 @@ class ModelManager:
             "embedding_model_loaded": self.embedding_model is not None,
             "model_type_in_use": "fast_multi_model" if self.fast_models else "original_single_model"
         }
+
+
+@lru_cache(maxsize=None)
+def get_model_manager() -> ModelManager:
+    """Return the process-wide ModelManager, loading the models on first use."""
+    return ModelManager()
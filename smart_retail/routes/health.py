@@ -4,13 +4,10 @@ Health check endpoints for the Smart Retail API.
 
 from fastapi import APIRouter, Depends
 from ..models.data_models import HealthResponse
-from ..models.ml_models import ModelManager
+from ..models.ml_models import get_model_manager
 
 router = APIRouter(prefix="/health", tags=["health"])
 
-# Global model manager instance
-model_manager = ModelManager()
-
 @router.get(
     "/",
     response_model=HealthResponse,
@@ -66,7 +63,7 @@ async def health_check():
     Returns:
         HealthResponse: Status of all system components
     """
-    health_status = model_manager.get_health_status()
+    health_status = get_model_manager().get_health_status()
     
     return HealthResponse(
         status="ok",
@@ -121,7 +118,7 @@ async def healthz():
     Returns:
         dict: Basic health status
     """
-    health_status = model_manager.get_health_status()
+    health_status = get_model_manager().get_health_status()
     
     return {
         "status": "ok",
@@ -4,14 +4,11 @@ Price prediction endpoints for the Smart Retail API.
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from ..models.data_models import PriceRequest, PredictionResponse
-from ..models.ml_models import ModelManager
+from ..models.ml_models import get_model_manager
 from ..utils.explainability import PricePredictionExplainer
 
 router = APIRouter(prefix="/predict", tags=["price-prediction"])
 
-# Global model manager instance
-model_manager = ModelManager()
-
 @router.post(
     "/price",
     response_model=PredictionResponse,
@@ -161,7 +158,7 @@ async def predict_price(
         product_data = request.dict()
         
         # Get prediction
-        prediction = model_manager.predict_price(product_data)
+        prediction = get_model_manager().predict_price(product_data)
         
         # Determine confidence level
         product_type = prediction.get('product_type', 'apparel')
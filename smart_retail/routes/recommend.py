@@ -4,13 +4,10 @@ Product recommendation endpoints for the Smart Retail API.
 
 from fastapi import APIRouter, HTTPException
 from ..models.data_models import SearchRequest, RecommendationResponse, RecommendationItem
-from ..models.ml_models import ModelManager
+from ..models.ml_models import get_model_manager
 
 router = APIRouter(prefix="/recommend", tags=["recommendations"])
 
-# Global model manager instance
-model_manager = ModelManager()
-
 @router.post(
     "/products",
     response_model=RecommendationResponse,
@@ -120,7 +117,7 @@ async def recommend_products(request: SearchRequest):
     """
     try:
         # Get recommendations
-        recommendations = model_manager.get_recommendations(
+        recommendations = get_model_manager().get_recommendations(
             query=request.query,
             k=request.k
         )
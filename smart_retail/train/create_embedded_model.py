@@ -47,16 +47,12 @@ def create_embedded_model():
         'shoes': 1.3, 'dress': 1.2, 'jeans': 1.1, 'shirt': 1.0
     }
     
-    prices = []
-    for _, row in df.iterrows():
-        price = base_price
-        price *= brand_multiplier.get(row['brand'], 1.0)
-        price *= category_multiplier.get(row['category'], 1.0)
-        price *= (1 - row['discount_percentage'] / 100)
-        price += np.random.normal(0, 100)  # Add some noise
-        prices.append(max(100, price))  # Minimum price of 100
-    
-    df['price'] = prices
+    brand_mul = df['brand'].map(brand_multiplier).fillna(1.0).to_numpy()
+    category_mul = df['category'].map(category_multiplier).fillna(1.0).to_numpy()
+    prices = base_price * brand_mul * category_mul * (1 - df['discount_percentage'].to_numpy() / 100)
+    prices += np.random.normal(0, 100, n_samples)  # Add some noise
+    
+    df['price'] = np.maximum(100, prices)  # Minimum price of 100
     
     # Prepare features and target
     feature_columns = ['brand', 'gender', 'category', 'fabric', 'pattern', 'color', 'number_of_ratings', 'discount_percentage']
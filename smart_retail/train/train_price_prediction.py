@@ -3,18 +3,81 @@ import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OrdinalEncoder, TargetEncoder
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from sklearn.pipeline import Pipeline
 from xgboost import XGBRegressor
 import joblib
 import re
+import hashlib
+import inspect
 import torch
-import gc
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Any
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Raw training data and where its prepared feature frame is cached between runs
+DATA_PATH = 'myntra_cleaned.parquet'
+FEATURE_CACHE_DIR = 'artifacts/feature_cache'
+
+# Bump to invalidate cached features after changes the cache key cannot see (e.g. library upgrades);
+# set REBUILD_FEATURES=1 to ignore the cache for a single run
+FEATURE_CACHE_VERSION = 1
+
+# Columns read from myntra_cleaned.parquet; everything else is derived
+USED_COLUMNS = ['product_name', 'brand', 'gender', 'category', 'fabric', 'pattern', 'color',
+                'rating_count', 'discount_percent', 'original_price', 'discounted_price']
+
+# Product types in classification priority order (also the categorical codes of product_type)
+PRODUCT_TYPES = ['jewelry', 'watches', 'luxury_apparel', 'apparel']
+
+# Rows per product type used for fast training
+TRAIN_SAMPLE_SIZE = 30_000
+
+# Upper edges of the price_range buckets (very_low, low, medium, high, very_high; above is ultra_high)
+PRICE_RANGE_EDGES = [500, 1000, 2000, 5000, 20000]
+
+# Low-cardinality string columns stored as pandas categoricals after loading
+CATEGORICAL_COLUMNS = ['brand', 'gender', 'category', 'fabric', 'pattern', 'color']
+
+# Size words in lowercased product names
+SIZE_PATTERN = re.compile(r'\b(?:xs|s|m|l|xl|xxl|xxxl|small|medium|large)\b')
+
+# Karat value in lowercased product names, e.g. "18kt" or "22 kt"
+KARAT_PATTERN = re.compile(r'(\d+)\s*kt')
+
+# Keyword flag groups: column prefix -> keywords matched in the product name
+KEYWORD_FLAGS = {
+    'has_': ['cotton', 'polyester', 'silk', 'wool', 'denim', 'leather', 'cashmere', 'pashmina',
+             'georgette', 'velvet', 'linen', 'chiffon', 'organza', 'net', 'lace',
+             'casual', 'formal', 'sport', 'party', 'wedding', 'ethnic', 'western', 'traditional',
+             'vintage', 'retro', 'modern', 'classic', 'trendy', 'elegant', 'chic'],
+    'jewelry_': ['gold', 'silver', 'platinum', 'diamond', 'gem', 'stone', 'pearl', 'crystal'],
+    'watch_': ['automatic', 'quartz', 'chronograph', 'digital', 'analog', 'waterproof', 'water resistant'],
+    'luxury_': ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade',
+                'embroidered', 'sequined', 'beaded', 'crystal', 'swarovski'],
+}
+
+# Every distinct keyword, longest first so a longer keyword wins when two start at the same position
+ALL_KEYWORDS = sorted({kw for keywords in KEYWORD_FLAGS.values() for kw in keywords}, key=len, reverse=True)
+
+# Zero-width lookahead reports every (possibly overlapping) occurrence, matching per-keyword substring tests
+KEYWORD_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, ALL_KEYWORDS)) + '))')
+
+# Aho-Corasick automaton over the same keywords (one walk per name regardless of keyword count)
+if AHOCORASICK_AVAILABLE:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for code, keyword in enumerate(ALL_KEYWORDS):
+        KEYWORD_AUTOMATON.add_word(keyword, code)
+    KEYWORD_AUTOMATON.make_automaton()
 
 
 class FastPricePredictor:
@@ -27,6 +90,7 @@ class FastPricePredictor:
         self.models = {}
         self.preprocessors = {}
         self.brand_prestige_scores = {}
+        self.brand_prestige_quartiles = None
         
     def check_gpu_availability(self):
         """Check if GPU is available and print GPU info"""
@@ -43,15 +107,11 @@ class FastPricePredictor:
             print("❌ GPU not available, falling back to CPU")
             return False
 
-    def clear_gpu_memory(self):
-        """Clear GPU memory cache"""
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            gc.collect()
-
     def classify_product_type(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Classify products into different types based on category and keywords"""
-        df = df.copy()
+        """Classify products into different types based on category and keywords
+        
+        Adds the product_type column to df in place and returns the same frame.
+        """
         
         # Define product type classification rules
         jewelry_keywords = ['ring', 'chain', 'earring', 'necklace', 'bracelet', 'pendant', 'bangle', 
@@ -63,100 +123,109 @@ class FastPricePredictor:
         luxury_keywords = ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade',
                           'cashmere', 'silk', 'leather', 'wool', 'pashmina', 'georgette', 'velvet']
         
-        # Classify based on category and keywords
-        def get_product_type(row):
-            category = str(row.get('category', '')).lower()
-            product_name = str(row.get('product_name', '')).lower()
-            
-            # Check for jewelry
-            if any(keyword in category or keyword in product_name for keyword in jewelry_keywords):
-                return 'jewelry'
-            
-            # Check for watches
-            if any(keyword in category or keyword in product_name for keyword in watch_keywords):
-                return 'watches'
-            
-            # Check for luxury items
-            if any(keyword in product_name for keyword in luxury_keywords):
-                return 'luxury_apparel'
-            
-            # Default to regular apparel
-            return 'apparel'
-        
-        df['product_type'] = df.apply(get_product_type, axis=1)
+        # Classify based on category and keywords, one vectorized scan per keyword list
+        product_name = df['product_name'].astype(str).str.lower()
+        category_and_name = df['category'].astype(str).str.lower() + ' ' + product_name
+        
+        def contains_any(text: pd.Series, keywords: List[str]) -> np.ndarray:
+            return text.str.contains('|'.join(map(re.escape, keywords)), regex=True).to_numpy()
+        
+        # First match wins: jewelry, then watches, then luxury items, else regular apparel
+        type_codes = np.select(
+            [
+                contains_any(category_and_name, jewelry_keywords),
+                contains_any(category_and_name, watch_keywords),
+                contains_any(product_name, luxury_keywords)
+            ],
+            [0, 1, 2],
+            default=3
+        )
+        df['product_type'] = pd.Categorical.from_codes(type_codes, PRODUCT_TYPES)
         return df
 
+    def fit_brand_prestige(self, df: pd.DataFrame):
+        """Compute per-brand average prices and their quartiles from the full dataset"""
+        # Factorize once and take sums / counts with bincount; missing brands (code -1) are left out
+        codes, brands = pd.factorize(df['brand'])
+        known = codes >= 0
+        codes = codes[known]
+        prices = df['original_price'].to_numpy(dtype=np.float64)[known]
+        brand_avg_prices = np.bincount(codes, weights=prices) / np.bincount(codes)
+        self.brand_prestige_scores = dict(zip(brands, brand_avg_prices))
+        self.brand_prestige_quartiles = np.quantile(brand_avg_prices, [0.25, 0.5, 0.75])
+
+    def sample_per_product_type(self, df: pd.DataFrame, sample_size: int = TRAIN_SAMPLE_SIZE) -> pd.DataFrame:
+        """Keep at most sample_size rows of each product type (same rows the trainer would sample)"""
+        samples = []
+        for _, df_type in df.groupby('product_type', sort=False, observed=True):
+            if len(df_type) > sample_size:
+                df_type = df_type.sample(sample_size, random_state=42)
+            samples.append(df_type)
+        return pd.concat(samples)
+
+    def extract_keyword_flags(self, names: pd.Series) -> pd.DataFrame:
+        """Build every keyword flag column from one pass over the lowercased product names"""
+        hits = np.zeros((len(names), len(ALL_KEYWORDS)), dtype=bool)
+        
+        if AHOCORASICK_AVAILABLE:
+            # Single automaton walk per name reports every keyword occurrence
+            for row, name in enumerate(names):
+                for _, keyword_code in KEYWORD_AUTOMATON.iter(name):
+                    hits[row, keyword_code] = True
+        else:
+            # One findall per name, then scatter the hits into the (rows x keywords) matrix
+            matches = pd.Series(names.str.findall(KEYWORD_PATTERN).to_numpy()).explode().dropna()
+            keyword_codes = pd.Categorical(matches.to_numpy(), categories=ALL_KEYWORDS).codes
+            hits[matches.index.to_numpy(), keyword_codes] = True
+        
+        keyword_index = {kw: i for i, kw in enumerate(ALL_KEYWORDS)}
+        flags = {
+            f'{prefix}{kw}': hits[:, keyword_index[kw]]
+            for prefix, keywords in KEYWORD_FLAGS.items()
+            for kw in keywords
+        }
+        return pd.DataFrame(flags, index=names.index)
+
     def extract_enhanced_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Extract enhanced features specific to different product types"""
-        df = df.copy()
+        """Extract enhanced features specific to different product types
         
-        # Basic features
-        df['has_size'] = df['product_name'].str.contains(r'\b(?:xs|s|m|l|xl|xxl|xxxl|small|medium|large)\b', case=False, na=False)
-        
-        # Material keywords (expanded)
-        materials = ['cotton', 'polyester', 'silk', 'wool', 'denim', 'leather', 'cashmere', 'pashmina', 
-                    'georgette', 'velvet', 'linen', 'chiffon', 'organza', 'net', 'lace']
-        for material in materials:
-            df[f'has_{material}'] = df['product_name'].str.contains(material, case=False, na=False)
+        New columns are built in a separate frame and joined once, so the input is never copied or modified.
+        """
+        # Lowercase the names once; every pattern below is matched case-sensitively against it
+        names = df['product_name'].fillna('').astype(str).str.lower()
         
-        # Style keywords (expanded)
-        styles = ['casual', 'formal', 'sport', 'party', 'wedding', 'ethnic', 'western', 'traditional',
-                 'vintage', 'retro', 'modern', 'classic', 'trendy', 'elegant', 'chic']
-        for style in styles:
-            df[f'has_{style}'] = df['product_name'].str.contains(style, case=False, na=False)
+        # Material, style, jewelry, watch and luxury keyword flags in a single scan
+        features = self.extract_keyword_flags(names)
         
-        # Jewelry-specific features
-        jewelry_materials = ['gold', 'silver', 'platinum', 'diamond', 'gem', 'stone', 'pearl', 'crystal']
-        for material in jewelry_materials:
-            df[f'jewelry_{material}'] = df['product_name'].str.contains(material, case=False, na=False)
+        # Basic features
+        features['has_size'] = names.str.contains(SIZE_PATTERN).to_numpy()
         
         # Extract karat information
-        df['karat'] = df['product_name'].str.extract(r'(\d+)\s*kt', flags=re.IGNORECASE).astype(float)
-        df['karat'] = df['karat'].fillna(0)
-        
-        # Watch-specific features
-        watch_features = ['automatic', 'quartz', 'chronograph', 'digital', 'analog', 'waterproof', 'water resistant']
-        for feature in watch_features:
-            df[f'watch_{feature}'] = df['product_name'].str.contains(feature, case=False, na=False)
+        features['karat'] = names.str.extract(KARAT_PATTERN, expand=False).astype(np.float32).fillna(0).to_numpy()
         
         # Brand prestige scoring (based on average prices)
-        brand_avg_prices = df.groupby('brand')['original_price'].mean().sort_values(ascending=False)
-        self.brand_prestige_scores = brand_avg_prices.to_dict()
-        
-        # Create brand prestige tiers
-        q25, q50, q75 = brand_avg_prices.quantile([0.25, 0.5, 0.75])
-        
-        def get_brand_prestige(brand):
-            avg_price = self.brand_prestige_scores.get(brand, 0)
-            if avg_price >= q75:
-                return 'ultra_premium'
-            elif avg_price >= q50:
-                return 'premium'
-            elif avg_price >= q25:
-                return 'mid_range'
-            else:
-                return 'budget'
-        
-        df['brand_prestige'] = df['brand'].apply(get_brand_prestige)
-        df['brand_avg_price'] = df['brand'].map(self.brand_prestige_scores).fillna(0)
-        
-        # Luxury keywords
-        luxury_keywords = ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade',
-                          'embroidered', 'sequined', 'beaded', 'crystal', 'swarovski']
-        for keyword in luxury_keywords:
-            df[f'luxury_{keyword}'] = df['product_name'].str.contains(keyword, case=False, na=False)
+        if self.brand_prestige_quartiles is None:
+            self.fit_brand_prestige(df)
+        brand_avg_price = df['brand'].map(self.brand_prestige_scores).astype(float).fillna(0).to_numpy()
+        features['brand_avg_price'] = brand_avg_price
+        
+        # Create brand prestige tiers (left-closed quartile buckets, robust to tied quartiles)
+        tier_codes = np.digitize(brand_avg_price, self.brand_prestige_quartiles)
+        features['brand_prestige'] = pd.Categorical.from_codes(
+            tier_codes, ['budget', 'mid_range', 'premium', 'ultra_premium']
+        )
         
         # Product name features
-        df['name_length'] = df['product_name'].str.len()
-        df['word_count'] = df['product_name'].str.split().str.len()
-        df['has_discount'] = (df['discount_percent'] > 0).astype(int)
+        features['name_length'] = df['product_name'].str.len().to_numpy()
+        features['word_count'] = df['product_name'].str.split().str.len().to_numpy()
+        features['has_discount'] = (df['discount_percent'] > 0).to_numpy()
         
-        # Price range indicators
-        df['price_range'] = pd.cut(df['original_price'], 
-                                 bins=[0, 500, 1000, 2000, 5000, 20000, float('inf')],
-                                 labels=['very_low', 'low', 'medium', 'high', 'very_high', 'ultra_high'])
+        # Price range indicators as ordered codes: 0=very_low (<=500) ... 5=ultra_high (>20000)
+        features['price_range'] = np.digitize(
+            df['original_price'].to_numpy(), PRICE_RANGE_EDGES, right=True
+        ).astype(np.int8)
         
-        return df
+        return pd.concat([df, features], axis=1)
 
     def get_features_for_product_type(self, product_type: str) -> Tuple[List[str], List[str]]:
         """Get appropriate features for each product type"""
@@ -164,16 +233,16 @@ class FastPricePredictor:
         base_numerical = ['rating_count', 'discount_percent', 'name_length', 'word_count', 'has_discount', 'brand_avg_price']
         
         if product_type == 'jewelry':
-            categorical = base_categorical + ['price_range']
-            numerical = base_numerical + ['karat'] + [f'jewelry_{mat}' for mat in ['gold', 'silver', 'platinum', 'diamond', 'gem', 'stone']]
+            categorical = base_categorical
+            numerical = base_numerical + ['price_range', 'karat'] + [f'jewelry_{mat}' for mat in ['gold', 'silver', 'platinum', 'diamond', 'gem', 'stone']]
             
         elif product_type == 'watches':
-            categorical = base_categorical + ['price_range']
-            numerical = base_numerical + [f'watch_{feat}' for feat in ['automatic', 'quartz', 'chronograph', 'digital', 'analog']]
+            categorical = base_categorical
+            numerical = base_numerical + ['price_range'] + [f'watch_{feat}' for feat in ['automatic', 'quartz', 'chronograph', 'digital', 'analog']]
             
         elif product_type == 'luxury_apparel':
-            categorical = base_categorical + ['price_range']
-            numerical = base_numerical + [f'luxury_{kw}' for kw in ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade']]
+            categorical = base_categorical
+            numerical = base_numerical + ['price_range'] + [f'luxury_{kw}' for kw in ['designer', 'couture', 'premium', 'exclusive', 'limited', 'handmade']]
             
         else:  # regular apparel
             categorical = base_categorical
@@ -184,14 +253,14 @@ class FastPricePredictor:
     def get_optimized_params(self, product_type: str, gpu_available: bool = False) -> Dict:
         """Get pre-optimized parameters for each product type"""
         base_config = {
-            'tree_method': 'gpu_hist' if gpu_available else 'hist',
+            'tree_method': 'hist',
             'device': 'cuda' if gpu_available else 'cpu',
             'random_state': 42,
             'verbosity': 0,
-            'max_bin': 512,
+            'max_bin': 256,
             'grow_policy': 'lossguide',
             'max_leaves': 0,
-            'sampling_method': 'gradient_based' if gpu_available else 'uniform'
+            'max_cat_to_onehot': 8
         }
         
         if product_type == 'jewelry':
@@ -239,8 +308,12 @@ class FastPricePredictor:
                 'reg_lambda': 1
             }
 
-    def train_specialized_model(self, df: pd.DataFrame, product_type: str, gpu_available: bool = False):
-        """Train a specialized model for a specific product type with pre-optimized parameters"""
+    def train_specialized_model(self, df: pd.DataFrame, product_type: str, gpu_available: bool = False,
+                                n_jobs: int = None):
+        """Train a specialized model for a specific product type with pre-optimized parameters
+        
+        n_jobs caps XGBoost's threads when several product types are trained in parallel.
+        """
         print(f"\n🚀 Training FAST model for {product_type}...")
         
         # Filter data for this product type
@@ -257,46 +330,55 @@ class FastPricePredictor:
         
         # Prepare data
         X = df_type[categorical_features + numerical_features]
-        y = np.log1p(df_type['original_price'])
+        y = df_type['log_price']
         
         # Use smaller sample for faster training
-        if len(df_type) > 30_000:
+        if len(df_type) > TRAIN_SAMPLE_SIZE:
             print(f"   Using 30k sample for fast training...")
-            df_sample = df_type.sample(30_000, random_state=42)
+            df_sample = df_type.sample(TRAIN_SAMPLE_SIZE, random_state=42)
             X_sample = df_sample[categorical_features + numerical_features]
-            y_sample = np.log1p(df_sample['original_price'])
+            y_sample = df_sample['log_price']
         else:
             X_sample = X
             y_sample = y
         
-        # Train-test split
+        # Train-test split, holding out part of the training data for early stopping
         X_train, X_test, y_train, y_test = train_test_split(X_sample, y_sample, test_size=0.2, random_state=42)
+        X_fit, X_val, y_fit, y_val = train_test_split(X_train, y_train, test_size=0.1, random_state=42)
         
-        # Preprocessing
+        # Preprocessing: high-cardinality brand becomes one target-encoded float; the remaining
+        # categoricals become ordinal codes that XGBoost splits on natively (no one-hot); trees are
+        # scale-invariant, so numeric features pass through unscaled
+        low_card_features = [col for col in categorical_features if col != 'brand']
         preprocessor = ColumnTransformer([
-            ('cat', OneHotEncoder(handle_unknown='ignore', min_frequency=5), categorical_features),
-            ('num', StandardScaler(), numerical_features)
+            ('brand', TargetEncoder(target_type='continuous', random_state=42), ['brand']),
+            ('cat', OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=np.nan, min_frequency=5, dtype=np.float32), low_card_features),
+            ('num', 'passthrough', numerical_features)
         ])
         
-        # Get optimized parameters
+        # Get optimized parameters; n_estimators acts as an upper bound under early stopping
         xgb_params = self.get_optimized_params(product_type, gpu_available)
+        if n_jobs is not None:
+            xgb_params['n_jobs'] = n_jobs
+        feature_types = ['q'] + ['c'] * len(low_card_features) + ['q'] * len(numerical_features)
+        model = XGBRegressor(
+            **xgb_params,
+            enable_categorical=True,
+            feature_types=feature_types,
+            early_stopping_rounds=50
+        )
         
-        # Create pipeline
+        print(f"   Training with pre-optimized parameters (no grid search)...")
+        
+        # Fit the preprocessor once and train directly without grid search on contiguous float32 matrices
+        X_fit_t = np.ascontiguousarray(preprocessor.fit_transform(X_fit, y_fit), dtype=np.float32)
+        X_val_t = np.ascontiguousarray(preprocessor.transform(X_val), dtype=np.float32)
+        model.fit(X_fit_t, y_fit, eval_set=[(X_val_t, y_val)], verbose=False)
         pipeline = Pipeline([
             ('preprocessor', preprocessor),
-            ('model', XGBRegressor(**xgb_params))
+            ('model', model)
         ])
-        
-        print(f"   Training with pre-optimized parameters (no grid search)...")
-        
-        # Clear memory before training
-        self.clear_gpu_memory()
-        
-        # Train directly without grid search
-        pipeline.fit(X_train, y_train)
-        
-        # Clear memory after training
-        self.clear_gpu_memory()
+        print(f"   Early stopping kept {model.best_iteration + 1} of {xgb_params['n_estimators']} trees")
         
         # Evaluate
         y_pred = pipeline.predict(X_test)
@@ -332,7 +414,7 @@ class FastPricePredictor:
         return pipeline
 
     def apply_price_constraints(self, predictions: np.ndarray, product_type: str) -> np.ndarray:
-        """Apply price constraints based on product type"""
+        """Apply price constraints based on product type (clips in place)"""
         constraints = {
             'jewelry': (100, 200000),      # ₹100 to ₹2L
             'watches': (500, 100000),      # ₹500 to ₹1L
@@ -341,30 +423,35 @@ class FastPricePredictor:
         }
         
         min_price, max_price = constraints.get(product_type, (50, 10000))
-        predictions = np.clip(predictions, min_price, max_price)
-        return predictions
+        return np.clip(predictions, min_price, max_price, out=predictions)
 
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """Make predictions using the appropriate specialized model"""
-        predictions = np.zeros(len(X))
+        # Booster output is float32; keep the result buffer in the same dtype to avoid upcasting copies
+        predictions = np.zeros(len(X), dtype=np.float32)
+        
+        # Compare small integer category codes instead of product type strings
+        type_codes = pd.Categorical(X['product_type'], categories=PRODUCT_TYPES).codes
         
-        for product_type in self.models.keys():
-            mask = X['product_type'] == product_type
-            if mask.sum() == 0:
+        for code, product_type in enumerate(PRODUCT_TYPES):
+            if product_type not in self.models:
+                continue
+            rows = np.flatnonzero(type_codes == code)
+            if len(rows) == 0:
                 continue
-                
-            X_type = X[mask]
-            categorical_features = self.preprocessors[product_type]['categorical_features']
-            numerical_features = self.preprocessors[product_type]['numerical_features']
             
-            X_features = X_type[categorical_features + numerical_features]
-            pred_log = self.models[product_type].predict(X_features)
-            pred_orig = np.expm1(pred_log)
+            feature_columns = X.columns.get_indexer(self.preprocessors[product_type]['feature_names'])
+            X_features = X.iloc[rows, feature_columns]
             
-            # Apply price constraints
-            pred_orig = self.apply_price_constraints(pred_orig, product_type)
+            # Transform once and score on the raw booster, skipping the Pipeline / sklearn wrapper layer
+            pipeline = self.models[product_type]
+            model = pipeline.named_steps['model']
+            X_mat = np.ascontiguousarray(pipeline.named_steps['preprocessor'].transform(X_features), dtype=np.float32)
+            pred = model.get_booster().inplace_predict(X_mat, iteration_range=(0, model.best_iteration + 1))
             
-            predictions[mask] = pred_orig
+            # Back to prices and apply price constraints, both in place
+            np.expm1(pred, out=pred)
+            predictions[rows] = self.apply_price_constraints(pred, product_type)
         
         return predictions
 
@@ -375,12 +462,12 @@ class FastPricePredictor:
         model_data = {
             'models': self.models,
             'preprocessors': self.preprocessors,
-            'brand_prestige_scores': self.brand_prestige_scores,
-            'product_classifier': self.classify_product_type
+            'brand_prestige_scores': self.brand_prestige_scores
         }
         
+        # zlib level 3 shrinks the pickled boosters cheaply and needs no extra dependency to load
         model_path = os.path.join(save_dir, 'fast_price_models.joblib')
-        joblib.dump(model_data, model_path)
+        joblib.dump(model_data, model_path, compress=3)
         print(f"💾 Saved fast models to {model_path}")
 
     def plot_metrics(self, product_type, y_true, y_pred, rmse, mae, r2, save_dir="artifacts/plots"):
@@ -423,22 +510,40 @@ class FastPricePredictor:
         print(f"📊 Saved plots for {product_type} under {save_dir}/{product_type}")
 
 
-def main():
-    """Main training function - FAST VERSION"""
-    print("⚡ Starting FAST Multi-Model Price Prediction Training...")
-    print("   (No grid search - using pre-optimized parameters)")
-    
-    # Initialize predictor
-    predictor = FastPricePredictor()
-    
-    # Check GPU availability
-    gpu_available = predictor.check_gpu_availability()
-    predictor.clear_gpu_memory()
-    
-    # Load and prepare data
+def feature_settings_hash() -> str:
+    """Short hash of everything that shapes the prepared feature frame: settings and the code that builds it"""
+    settings = (FEATURE_CACHE_VERSION, USED_COLUMNS, PRODUCT_TYPES, TRAIN_SAMPLE_SIZE, PRICE_RANGE_EDGES,
+                CATEGORICAL_COLUMNS, KEYWORD_FLAGS, SIZE_PATTERN.pattern, KARAT_PATTERN.pattern)
+    builders = (FastPricePredictor.classify_product_type, FastPricePredictor.fit_brand_prestige,
+                FastPricePredictor.sample_per_product_type, FastPricePredictor.extract_keyword_flags,
+                FastPricePredictor.extract_enhanced_features, prepare_training_data)
+    digest = hashlib.sha1(repr(settings).encode())
+    for builder in builders:
+        digest.update(inspect.getsource(builder).encode())
+    return digest.hexdigest()[:12]
+
+
+def feature_cache_paths(data_path: str = DATA_PATH) -> Tuple[str, str]:
+    """Cache file paths for the prepared features, keyed by the data file's mtime and size and the feature settings"""
+    stat = os.stat(data_path)
+    key = f"{stat.st_mtime_ns:x}_{stat.st_size:x}_{feature_settings_hash()}"
+    base = os.path.join(FEATURE_CACHE_DIR, f"features_{key}")
+    return f"{base}.parquet", f"{base}.joblib"
+
+
+def _train_in_worker(predictor: FastPricePredictor, df_type: pd.DataFrame, product_type: str,
+                     n_jobs: int) -> Tuple[Any, Dict]:
+    """Train one product type in a worker process and return what the parent needs to register"""
+    predictor.train_specialized_model(df_type, product_type, gpu_available=False, n_jobs=n_jobs)
+    return predictor.models.get(product_type), predictor.preprocessors.get(product_type)
+
+
+def prepare_training_data(predictor: FastPricePredictor, features_path: str, brand_stats_path: str) -> pd.DataFrame:
+    """Load, classify, sample and featurize the raw data, then cache the result for later runs"""
     print("\n📊 Loading and preparing data...")
-    df = pd.read_parquet('myntra_cleaned.parquet')
+    df = pd.read_parquet(DATA_PATH, columns=USED_COLUMNS)
     df = df[(df['original_price'] > 0) & (df['discounted_price'] > 0)]
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
     
     # Classify product types
     print("🔍 Classifying product types...")
@@ -450,14 +555,69 @@ def main():
     for ptype, count in type_counts.items():
         print(f"  {ptype}: {count:,} items ({count/len(df)*100:.1f}%)")
     
+    # Brand statistics come from the full dataset; features are only built for the training sample
+    predictor.fit_brand_prestige(df)
+    df = predictor.sample_per_product_type(df)
+    
     # Extract enhanced features
     print("\n✨ Extracting enhanced features...")
     df = predictor.extract_enhanced_features(df)
     
+    # Log-price target, computed once for every product type
+    df['log_price'] = np.log1p(df['original_price'].to_numpy(dtype=np.float32))
+    
+    # Cache the prepared frame and the full-dataset brand statistics it was built with
+    os.makedirs(FEATURE_CACHE_DIR, exist_ok=True)
+    df.to_parquet(features_path, compression='zstd')
+    joblib.dump((predictor.brand_prestige_scores, predictor.brand_prestige_quartiles), brand_stats_path)
+    
+    return df
+
+
+def main():
+    """Main training function - FAST VERSION"""
+    print("⚡ Starting FAST Multi-Model Price Prediction Training...")
+    print("   (No grid search - using pre-optimized parameters)")
+    
+    # Initialize predictor
+    predictor = FastPricePredictor()
+    
+    # Check GPU availability
+    gpu_available = predictor.check_gpu_availability()
+    
+    # Reuse prepared features when neither the raw data nor the feature code has changed since they were cached
+    features_path, brand_stats_path = feature_cache_paths()
+    use_cache = os.getenv('REBUILD_FEATURES') != '1'
+    if use_cache and os.path.exists(features_path) and os.path.exists(brand_stats_path):
+        print(f"\n📦 Loading cached features from {features_path}...")
+        df = pd.read_parquet(features_path)
+        predictor.brand_prestige_scores, predictor.brand_prestige_quartiles = joblib.load(brand_stats_path)
+    else:
+        df = prepare_training_data(predictor, features_path, brand_stats_path)
+    
     # Train specialized models
     print("\n🎯 Training specialized models (FAST MODE)...")
-    for product_type in df['product_type'].unique():
-        predictor.train_specialized_model(df, product_type, gpu_available)
+    product_types = df['product_type'].unique()
+    if gpu_available:
+        # One device: train sequentially rather than contend for it
+        for product_type in product_types:
+            predictor.train_specialized_model(df, product_type, gpu_available)
+    else:
+        # Product types are independent; train them in parallel with outer x inner threads <= cores
+        n_workers = max(1, min(len(product_types), os.cpu_count() or 1))
+        n_jobs = max(1, (os.cpu_count() or 1) // n_workers)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                product_type: executor.submit(
+                    _train_in_worker, predictor, df[df['product_type'] == product_type], product_type, n_jobs
+                )
+                for product_type in product_types
+            }
+            for product_type, future in futures.items():
+                pipeline, feature_info = future.result()
+                if pipeline is not None:
+                    predictor.models[product_type] = pipeline
+                    predictor.preprocessors[product_type] = feature_info
     
     # Save models
     predictor.save_models()
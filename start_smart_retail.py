@@ -12,20 +12,23 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 if __name__ == "__main__":
     import uvicorn
-    from smart_retail.main import app
     
     # Get configuration from environment variables
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8001))
+    # Each worker process loads its own copy of the models
+    workers = int(os.getenv("UVICORN_WORKERS", os.getenv("WEB_CONCURRENCY", 1)))
     
     print(f"Starting GenAI Smart Retail API on {host}:{port}")
     print(f"API Documentation: http://{host}:{port}/docs")
     print(f"ReDoc Documentation: http://{host}:{port}/redoc")
     
+    # Pass the app as an import string so uvicorn can start multiple workers
     uvicorn.run(
-        app,
+        "smart_retail.main:app",
         host=host,
         port=port,
         reload=False,
+        workers=workers,
         log_level="info"
     )